@@ -1,29 +1,109 @@
+import bisect
+import functools
 import numbers
-import re
 
 
 __all__ = ["Period"]
 
 
-_TIME_UNITS = {
-    "s":  1_000_000_000_000_000,
-    "ms": 1_000_000_000_000,
-    "us": 1_000_000_000,
-    "ns": 1_000_000,
-    "ps": 1_000,
-    "fs": 1,
+# Scale in femtoseconds of each unit accepted by the `Period` constructor, and whether the unit
+# is a frequency (in which case the scale is divided by the value) rather than a time.
+_UNITS = {
+    "s":   (1_000_000_000_000_000, False),
+    "ms":  (1_000_000_000_000, False),
+    "us":  (1_000_000_000, False),
+    "ns":  (1_000_000, False),
+    "ps":  (1_000, False),
+    "fs":  (1, False),
+    "Hz":  (1_000_000_000_000_000, True),
+    "kHz": (1_000_000_000_000, True),
+    "MHz": (1_000_000_000, True),
+    "GHz": (1_000_000, True),
 }
 
 
-_FREQUENCY_UNITS = {
-    "Hz":  1_000_000_000_000_000,
-    "kHz": 1_000_000_000_000,
-    "MHz": 1_000_000_000,
-    "GHz": 1_000_000,
+_REPR_UNITS = ("fs", "ps", "ns", "us", "ms", "s")
+
+
+# Magnitude thresholds (in femtoseconds) at which `__format__` switches to the next larger unit,
+# and the SI prefixes of the units selected for each interval between them.
+_AUTO_UNIT_THRESHOLDS = (
+    1_000,
+    1_000_000,
+    1_000_000_000,
+    1_000_000_000_000,
+    1_000_000_000_000_000,
+)
+_AUTO_UNIT_PREFIXES = ("f", "p", "n", "u", "m", "")
+
+
+# Divisor and number of fractional digits used by `__format__` for each time unit prefix.
+_FORMAT_TIME_SCALES = {
+    "":  (1_000_000_000_000_000, 15),
+    "m": (1_000_000_000_000, 12),
+    "u": (1_000_000_000, 9),
+    "n": (1_000_000, 6),
+    "p": (1_000, 3),
+    "f": (1, 0),
+}
+
+
+# Time unit prefix and frequency unit prefix for each unit accepted in a format specifier.
+_FORMAT_UNITS = {
+    "s":   ("",  None),
+    "ms":  ("m", None),
+    "us":  ("u", None),
+    "ns":  ("n", None),
+    "ps":  ("p", None),
+    "fs":  ("f", None),
+    "Hz":  (None, ""),
+    "kHz": (None, "k"),
+    "MHz": (None, "M"),
+    "GHz": (None, "G"),
 }
 
 
+def _scan_digits(string, pos):
+    while pos < len(string) and "0" <= string[pos] <= "9":
+        pos += 1
+    return pos
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_format_spec(format_spec):
+    # Parses `[width][.precision][ ][unit]`, returning the fields as
+    # `(width, precision, space, unit, s_unit, hz_unit)`.
+    width = precision = None
+    pos = 0
+
+    if "1" <= format_spec[:1] <= "9":
+        end = _scan_digits(format_spec, 1)
+        width, pos = format_spec[:end], end
+
+    if format_spec[pos:pos + 1] == ".":
+        end = _scan_digits(format_spec, pos + 1)
+        if end == pos + 1:
+            raise ValueError(f"Invalid format specifier '{format_spec}' for object of type 'Period'")
+        precision, pos = format_spec[pos:end], end
+
+    space = ""
+    if format_spec[pos:pos + 1] == " ":
+        space, pos = " ", pos + 1
+
+    unit = format_spec[pos:] or None
+    if unit is None:
+        s_unit = hz_unit = None
+    elif unit in _FORMAT_UNITS:
+        s_unit, hz_unit = _FORMAT_UNITS[unit]
+    else:
+        raise ValueError(f"Invalid format specifier '{format_spec}' for object of type 'Period'")
+
+    return width, precision, space, unit, s_unit, hz_unit
+
+
 class Period:
+    __slots__ = ("_femtoseconds", "_hertz")
+
     def __init__(self, **kwargs):
         if not kwargs:
             self._femtoseconds = 0
@@ -33,23 +113,44 @@ class Period:
             raise TypeError("Period accepts at most one argument")
 
         (unit, value), = kwargs.items()
+        unit_info = _UNITS.get(unit)
 
-        if not isinstance(value, numbers.Real):
+        if type(value) is int and unit_info is not None and not unit_info[1]:
+            # The product of two integers is exact and needs no rounding.
+            self._femtoseconds = value * unit_info[0]
+            return
+
+        # Check for the built-in types first, as ABC instance checks are comparatively slow.
+        if not (isinstance(value, (int, float)) or isinstance(value, numbers.Real)):
             raise TypeError(f"{unit} value must be a real number")
 
-        if unit in _TIME_UNITS:
-            self._femtoseconds = round(value * _TIME_UNITS[unit])
+        if unit_info is None:
+            raise TypeError(f"{unit} is not a valid unit")
+
+        scale, is_frequency = unit_info
+        if not is_frequency:
+            self._femtoseconds = round(value * scale)
 
-        elif unit in _FREQUENCY_UNITS:
+        else:
             if value == 0:
                 raise ZeroDivisionError("Frequency can't be zero")
             elif value < 0:
                 raise ValueError("Frequency can't be negative")
 
-            self._femtoseconds = round(_FREQUENCY_UNITS[unit] / value)
-
-        else:
-            raise TypeError(f"{unit} is not a valid unit")
+            if type(value) is int and scale % value == 0:
+                self._femtoseconds = scale // value
+            else:
+                self._femtoseconds = round(scale / value)
+
+    @classmethod
+    def _from_fs(cls, fs):
+        # Internal constructor for results of arithmetic; `fs` must already be an integer.
+        # Periods are immutable, so commonly occurring values are shared.
+        self = _INTERNED_PERIODS.get(fs) if cls is Period else None
+        if self is None:
+            self = cls.__new__(cls)
+            self._femtoseconds = fs
+        return self
 
     @property
     def seconds(self):
@@ -83,8 +184,13 @@ class Period:
 
     @property
     def hertz(self):
+        try:
+            return self._hertz
+        except AttributeError:
+            pass
         self._check_reciprocal()
-        return 1_000_000_000_000_000 / self._femtoseconds
+        self._hertz = 1_000_000_000_000_000 / self._femtoseconds
+        return self._hertz
 
     @property
     def kilohertz(self):
@@ -131,6 +237,14 @@ class Period:
             return NotImplemented
         return self._femtoseconds >= other._femtoseconds
 
+    def __reduce__(self):
+        # Needed for pickle protocols 0 and 1, which do not support `__slots__` on their own.
+        return (type(self)._from_fs, (self._femtoseconds,))
+
+    def __setstate__(self, state):
+        # Pickles created before `__slots__` was added store the instance dictionary as state.
+        self._femtoseconds = state["_femtoseconds"]
+
     def __hash__(self):
         return hash(self._femtoseconds)
 
@@ -138,36 +252,40 @@ class Period:
         return bool(self._femtoseconds)
 
     def __neg__(self):
-        return Period(fs=-self._femtoseconds)
+        return Period._from_fs(-self._femtoseconds)
 
     def __pos__(self):
         return self
 
     def __abs__(self):
-        return Period(fs=abs(self._femtoseconds))
+        return Period._from_fs(abs(self._femtoseconds))
 
     def __add__(self, other):
         if not isinstance(other, Period):
             return NotImplemented
-        return Period(fs=self._femtoseconds + other._femtoseconds)
+        return Period._from_fs(self._femtoseconds + other._femtoseconds)
 
     def __sub__(self, other):
         if not isinstance(other, Period):
             return NotImplemented
-        return Period(fs=self._femtoseconds - other._femtoseconds)
+        return Period._from_fs(self._femtoseconds - other._femtoseconds)
 
     def __mul__(self, other):
-        if not isinstance(other, numbers.Real):
+        if type(other) is int:
+            return Period._from_fs(self._femtoseconds * other)
+        if not (isinstance(other, (int, float)) or isinstance(other, numbers.Real)):
             return NotImplemented
-        return Period(fs=self._femtoseconds * other)
+        return Period._from_fs(round(self._femtoseconds * other))
 
     __rmul__ = __mul__
 
     def __truediv__(self, other):
         if isinstance(other, Period):
             return self._femtoseconds / other._femtoseconds
-        elif isinstance(other, numbers.Real):
-            return Period(fs=self._femtoseconds / other)
+        elif type(other) is int and other != 0 and self._femtoseconds % other == 0:
+            return Period._from_fs(self._femtoseconds // other)
+        elif isinstance(other, (int, float)) or isinstance(other, numbers.Real):
+            return Period._from_fs(round(self._femtoseconds / other))
         else:
             return NotImplemented
 
@@ -179,56 +297,37 @@ class Period:
     def __mod__(self, other):
         if not isinstance(other, Period):
             return NotImplemented
-        return Period(fs=self._femtoseconds % other._femtoseconds)
+        return Period._from_fs(self._femtoseconds % other._femtoseconds)
 
     def __str__(self):
         return self.__format__("")
 
     def __format__(self, format_spec):
-        m = re.match(r"^([1-9]\d*)?(\.\d+)?( ?)(([munpf]?)s|([kMG]?)Hz)?$", format_spec)
-
-        if m is None:
-            raise ValueError(f"Invalid format specifier '{format_spec}' for object of type 'Period'")
-
-        width, precision, space, unit, s_unit, hz_unit = m.groups()
+        width, precision, space, unit, s_unit, hz_unit = _parse_format_spec(format_spec)
 
         if unit is None:
-            if abs(self._femtoseconds) >= 1_000_000_000_000_000:
-                s_unit = ""
-            elif abs(self._femtoseconds) >= 1_000_000_000_000:
-                s_unit = "m"
-            elif abs(self._femtoseconds) >= 1_000_000_000:
-                s_unit = "u"
-            elif abs(self._femtoseconds) >= 1_000_000:
-                s_unit = "n"
-            elif abs(self._femtoseconds) >= 1_000:
-                s_unit = "p"
-            else:
-                s_unit = "f"
-
+            magnitude = abs(self._femtoseconds)
+            s_unit = _AUTO_UNIT_PREFIXES[bisect.bisect_right(_AUTO_UNIT_THRESHOLDS, magnitude)]
             unit = f"{s_unit}s"
 
         if s_unit is not None:
-            div, digits = {
-                "":  (1_000_000_000_000_000, 15),
-                "m": (1_000_000_000_000, 12),
-                "u": (1_000_000_000, 9),
-                "n": (1_000_000, 6),
-                "p": (1_000, 3),
-                "f": (1, 0),
-            }[s_unit]
+            div, digits = _FORMAT_TIME_SCALES[s_unit]
             integer, decimal = divmod(self._femtoseconds, div)
 
-            if precision:
-                precision = int(precision[1:])
-                decimal = round(decimal * 10**(precision - digits))
-                digits = precision
+            if decimal == 0 and not precision:
+                value = f"{integer}"
+
+            else:
+                if precision:
+                    precision = int(precision[1:])
+                    decimal = round(decimal * 10**(precision - digits))
+                    digits = precision
 
-            value = f"{integer}.{decimal:0{digits}}"
+                value = f"{integer}.{decimal:0{digits}}"
 
-            if not precision:
-                value = value.rstrip('0')
-            value = value.rstrip('.')
+                if not precision:
+                    value = value.rstrip('0')
+                value = value.rstrip('.')
 
         else:
             if hz_unit == "":
@@ -247,6 +346,18 @@ class Period:
         return str
 
     def __repr__(self):
-        for unit, div in _TIME_UNITS.items():
-            if self._femtoseconds % div == 0:
-                return f"Period({unit}={self._femtoseconds // div})"
+        # Strip groups of three trailing zeroes to find the largest unit that represents the period
+        # exactly; this only ever divides by 1000 rather than by each of the unit scales in turn.
+        value, unit_index = self._femtoseconds, 0
+        while unit_index < len(_REPR_UNITS) - 1 and value % 1000 == 0:
+            value //= 1000
+            unit_index += 1
+        return f"Period({_REPR_UNITS[unit_index]}={value})"
+
+
+# Zero and the periods of common clock frequencies.
+_INTERNED_PERIODS = {}
+_INTERNED_PERIODS.update((fs, Period._from_fs(fs)) for fs in (
+    0,
+    *(ns * 1_000_000 for ns in (1, 2, 4, 5, 8, 10, 20, 40, 50, 100, 1000)),
+))
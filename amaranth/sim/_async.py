@@ -82,7 +82,7 @@ class DelayTrigger:
                 DeprecationWarning, stacklevel=1)
             interval = Period(s=interval)
 
-        if interval < Period():
+        if interval.femtoseconds < 0:
             raise ValueError(f"Delay cannot be negative")
         self.interval = interval
 
@@ -694,7 +694,7 @@ class SimulatorContext:
     def elapsed_time(self) -> Period:
         """Return the currently elapsed simulation time."""
 
-        return Period(fs = self._engine.now)
+        return Period._from_fs(self._engine.now)
 
 
 class ProcessContext(SimulatorContext):
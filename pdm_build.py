@@ -1,20 +1,27 @@
+import functools
 import os
-from datetime import datetime
+import time
 from pdm.backend.hooks.version import SCMVersion
 from pdm.backend._vendor.packaging.version import Version
 
 
 def format_version(version: SCMVersion) -> str:
-    major, minor, patch = (int(n) for n in str(version.version).split(".")[:3])
-    dirty = f"+{datetime.utcnow():%Y%m%d.%H%M%S}" if version.dirty else ""
+    # Versions with fewer than three components (e.g. `0.5`) are padded with zeroes.
+    major, minor, patch, *_ = (*(int(n) for n in str(version.version).split(".")[:3]), 0, 0)
+    dirty = f"+{time.strftime('%Y%m%d.%H%M%S', time.gmtime())}" if version.dirty else ""
     if version.distance is None:
         return f"{major}.{minor}.{patch}{dirty}"
     else:
         return f"{major}.{minor}.{patch}.dev{version.distance}{dirty}"
 
 
+@functools.lru_cache
+def _parse_version(version: str) -> Version:
+    return Version(version)
+
+
 def pdm_build_initialize(context):
-    version = Version(context.config.metadata["version"])
+    version = _parse_version(context.config.metadata["version"])
 
     # This is done in a PDM build hook without specifying `dynamic = [..., "version"]` to put all
     # of the static metadata into pyproject.toml. Tools other than PDM will not execute this script
@@ -1,8 +1,16 @@
+import copy
+import pickle
+from fractions import Fraction
+
 from amaranth.hdl._time import *
 
 from .utils import *
 
 
+class PeriodSubclass(Period):
+    pass
+
+
 class PeriodTestCase(FHDLTestCase):
     def test_constructor(self):
         self.assertEqual(Period().femtoseconds, 0)
@@ -19,6 +27,14 @@ class PeriodTestCase(FHDLTestCase):
         self.assertEqual(Period(kHz=5).femtoseconds, 200_000_000_000)
         self.assertEqual(Period( Hz=5).femtoseconds, 200_000_000_000_000)
 
+        self.assertEqual(Period(ns=1.5).femtoseconds, 1_500_000)
+        self.assertEqual(Period(MHz=3).femtoseconds, 333_333_333)
+        self.assertEqual(Period(MHz=2.5).femtoseconds, 400_000_000)
+        self.assertIsInstance(Period(ns=1.5).femtoseconds, int)
+        self.assertIsInstance(Period(MHz=3).femtoseconds, int)
+
+        self.assertEqual(Period(ns=Fraction(3, 2)).femtoseconds, 1_500_000)
+
     def test_constructor_exceptions(self):
         with self.assertRaisesRegex(TypeError,
                 r"^Period accepts at most one argument$"):
@@ -53,14 +69,28 @@ class PeriodTestCase(FHDLTestCase):
         self.assertEqual(Period(GHz=5).kilohertz, 5_000_000.0)
         self.assertEqual(Period(GHz=5).hertz,     5_000_000_000.0)
 
+    def test_accessor_cached(self):
+        period = Period(MHz=3)
+        self.assertEqual(period.hertz, 1_000_000_000_000_000 / period.femtoseconds)
+        self.assertIs(period.hertz, period.hertz)
+
     def test_accessor_exceptions(self):
         with self.assertRaisesRegex(ZeroDivisionError,
-                r"^Can't calculate the frequency of a zero period$"):
+                r"^Can't calculate the frequency of a zero period$") as cm:
             Period(s=0).hertz
+        self.assertIsNone(cm.exception.__context__)
 
         with self.assertRaisesRegex(ValueError,
-                r"^Can't calculate the frequency of a negative period$"):
+                r"^Can't calculate the frequency of a negative period$") as cm:
             Period(s=-1).hertz
+        self.assertIsNone(cm.exception.__context__)
+
+        period = Period(s=0)
+        for _ in range(2):
+            with self.assertRaisesRegex(ZeroDivisionError,
+                    r"^Can't calculate the frequency of a zero period$") as cm:
+                period.hertz
+            self.assertIsNone(cm.exception.__context__)
 
     def test_operators(self):
         for a, b in [(3, 5), (3, 3), (5, 3)]:
@@ -88,6 +118,49 @@ class PeriodTestCase(FHDLTestCase):
         self.assertEqual(Period(s=15) / Period(s=3), 5.0)
         self.assertEqual(Period(s=8) // Period(s=3), 2)
         self.assertEqual(Period(s=8) % Period(s=3), Period(s=2))
+        self.assertEqual(Period(s=3) * Fraction(1, 3), Period(s=1))
+        self.assertEqual(Period(s=3) / Fraction(3, 2), Period(s=2))
+
+    def test_operators_round(self):
+        self.assertEqual((Period(fs=5) * 0.5).femtoseconds, 2)
+        self.assertIsInstance((Period(fs=5) * 0.5).femtoseconds, int)
+        self.assertEqual((Period(fs=10) / 3).femtoseconds, 3)
+        self.assertIsInstance((Period(fs=10) / 3).femtoseconds, int)
+
+    def test_operators_exact(self):
+        self.assertEqual((Period(fs=10**18 + 1) * 3).femtoseconds, 3 * 10**18 + 3)
+        self.assertEqual((Period(fs=3 * 10**18 + 3) / 3).femtoseconds, 10**18 + 1)
+
+    def test_pickle(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(Period(ns=10), protocol)), Period(ns=10))
+            period = pickle.loads(pickle.dumps(PeriodSubclass(ns=10), protocol))
+            self.assertIs(type(period), PeriodSubclass)
+            self.assertEqual(period, Period(ns=10))
+
+    def test_pickle_legacy(self):
+        # Pickles of `Period(ns=10)` created before `Period` had `__slots__`.
+        for data in [
+            b"ccopy_reg\n_reconstructor\np0\n(camaranth.hdl._time\nPeriod\np1\nc__builtin__\n"
+            b"object\np2\nNtp3\nRp4\n(dp5\nV_femtoseconds\np6\nI10000000\nsb.",
+            b"\x80\x02camaranth.hdl._time\nPeriod\nq\x00)\x81q\x01}q\x02X\r\x00\x00\x00"
+            b"_femtosecondsq\x03J\x80\x96\x98\x00sb.",
+            b"\x80\x04\x95=\x00\x00\x00\x00\x00\x00\x00\x8c\x12amaranth.hdl._time\x94\x8c\x06"
+            b"Period\x94\x93\x94)\x81\x94}\x94\x8c\r_femtoseconds\x94J\x80\x96\x98\x00sb.",
+        ]:
+            self.assertEqual(pickle.loads(data), Period(ns=10))
+
+    def test_copy(self):
+        for period in [Period(ns=10), PeriodSubclass(ns=10)]:
+            self.assertIs(type(copy.copy(period)), type(period))
+            self.assertIs(type(copy.deepcopy(period)), type(period))
+            self.assertEqual(copy.deepcopy(period), period)
+
+    def test_interned(self):
+        self.assertIs(Period(ns=10) - Period(ns=10), Period(ns=5) - Period(ns=5))
+        self.assertIs(Period(ns=5) * 2, Period(ns=20) / 2)
+        self.assertIs(pickle.loads(pickle.dumps(Period())), Period(ns=5) - Period(ns=5))
+        self.assertIs(type(copy.copy(PeriodSubclass())), PeriodSubclass)
 
     def test_invalid_operands(self):
         with self.assertRaises(TypeError):
@@ -109,6 +182,12 @@ class PeriodTestCase(FHDLTestCase):
             Period(s=5) * Period(s=3)
         with self.assertRaises(TypeError):
             Period(s=5) / "three"
+        with self.assertRaisesRegex(ZeroDivisionError,
+                r"division by zero$"):
+            Period(s=5) / 0
+        with self.assertRaisesRegex(ZeroDivisionError,
+                r"division by zero$"):
+            Period(s=5) / 0.0
         with self.assertRaises(TypeError):
             Period(s=5) // 3
         with self.assertRaises(TypeError):
@@ -121,21 +200,41 @@ class PeriodTestCase(FHDLTestCase):
         self.assertEqual(str(Period(ns=5)), "5ns")
         self.assertEqual(str(Period(ps=5)), "5ps")
         self.assertEqual(str(Period(fs=5)), "5fs")
+        self.assertEqual(str(Period(fs=0)), "0fs")
+        self.assertEqual(str(Period(fs=999)), "999fs")
+        self.assertEqual(str(Period(fs=1_000)), "1ps")
+        self.assertEqual(str(Period(ns=999_999)), "999.999us")
+        self.assertEqual(str(Period(s=1_000)), "1000s")
 
     def test_repr(self):
         self.assertRepr(Period( s=5), "Period(s=5)")
         self.assertRepr(Period(ms=5), "Period(ms=5)")
+        self.assertRepr(Period(fs=5), "Period(fs=5)")
+        self.assertRepr(Period(ns=1500), "Period(ns=1500)")
+        self.assertRepr(Period(s=-3000), "Period(s=-3000)")
+        self.assertRepr(Period(), "Period(s=0)")
 
     def test_format(self):
         with self.assertRaisesRegex(ValueError,
                 r"^Invalid format specifier 'foo' for object of type 'Period'"):
             f"{Period(s=5):foo}"
+        for format_spec in ["0", "1.", ".s", "  ns", "ns ", "Ms", "ks", "mHz"]:
+            with self.assertRaisesRegex(ValueError,
+                    r"^Invalid format specifier '.*' for object of type 'Period'"):
+                format(Period(s=5), format_spec)
+        with self.assertRaises(ValueError):
+            format(Period(s=5), "ns\n")
 
         self.assertEqual(f"{Period(ms=1234):}", "1.234s")
         self.assertEqual(f"{Period(ms=1234):ms}", "1234ms")
         self.assertEqual(f"{Period(ms=1234):.1}", "1.2s")
         self.assertEqual(f"{Period(ms=1234): }", "1.234 s")
         self.assertEqual(f"{Period(ms=1234):10}", "    1.234s")
+        self.assertEqual(f"{Period(ms=2000):}", "2s")
+        self.assertEqual(f"{Period(ms=2000):us}", "2000000us")
+        self.assertEqual(f"{Period(ms=2000):.2}", "2.00s")
+        self.assertEqual(f"{Period(ms=1234):12.2 ms}", "  1234.00 ms")
+        self.assertEqual(f"{Period(ms=1234):8 }", " 1.234 s")
 
         self.assertEqual(f"{Period(MHz=1250):.0Hz}", "1250000000Hz")
         self.assertEqual(f"{Period(MHz=1250):.0kHz}", "1250000kHz")